@@ -1,21 +1,47 @@
 """Emulates an IntesisBox device on TCP port 3310."""
 
+import argparse
 import asyncio
+import multiprocessing
+import operator
+import signal
+import socket
 
-MODE_AUTO = "AUTO"
-MODE_DRY = "DRY"
-MODE_FAN = "FAN"
-MODE_COOL = "COOL"
-
-FUNCTION_ONOFF = "ONOFF"
-FUNCTION_MODE = "MODE"
-FUNCTION_SETPOINT = "SETPTEMP"
-FUNCTION_FANSP = "FANSP"
-FUNCTION_VANEUD = "VANEUD"
-FUNCTION_VANELR = "VANELR"
-FUNCTION_AMBTEMP = "AMBTEMP"
-FUNCTION_ERRSTATUS = "ERRSTATUS"
-FUNCTION_ERRCODE = "ERRCODE"
+MODE_AUTO = b"AUTO"
+MODE_DRY = b"DRY"
+MODE_FAN = b"FAN"
+MODE_COOL = b"COOL"
+
+FUNCTION_ONOFF = b"ONOFF"
+FUNCTION_MODE = b"MODE"
+FUNCTION_SETPOINT = b"SETPTEMP"
+FUNCTION_FANSP = b"FANSP"
+FUNCTION_VANEUD = b"VANEUD"
+FUNCTION_VANELR = b"VANELR"
+FUNCTION_AMBTEMP = b"AMBTEMP"
+FUNCTION_ERRSTATUS = b"ERRSTATUS"
+FUNCTION_ERRCODE = b"ERRCODE"
+
+LIMITS = {
+    FUNCTION_FANSP: [b"AUTO", b"1", b"2", b"3", b"4"],
+    FUNCTION_VANEUD: [b"AUTO", b"1", b"2", b"3", b"SWING"],
+    FUNCTION_VANELR: [b"AUTO", b"1", b"2", b"3", b"SWING"],
+    FUNCTION_SETPOINT: [b"160", b"300"],
+    FUNCTION_MODE: [b"AUTO", b"HEAT", b"DRY", b"COOL", b"FAN"],
+}
+
+# The limits never change, so their replies are only built once.
+LIMITS_RESPONSES = {
+    function: b"LIMITS:" + function + b",[" + b",".join(values) + b"]\r\n"
+    for function, values in LIMITS.items()
+}
+
+ACK = b"ACK\r\n"
+ERR = b"ERR\r\n"
+
+RECEIVE_BUFFER_SIZE = 65536
+# Drop unterminated input beyond this many bytes; no WMP line is this long.
+MAX_LINE_LENGTH = 1024
 
 RW_FUNCTIONS = [
     FUNCTION_ONOFF,
@@ -26,8 +52,42 @@ RW_FUNCTIONS = [
     FUNCTION_FANSP,
 ]
 
+# DeviceState attribute holding each function, in GET,1:* reply order.
+FUNCTION_TO_SLOT = {
+    FUNCTION_MODE: "mode",
+    FUNCTION_SETPOINT: "setpoint",
+    FUNCTION_ONOFF: "onoff",
+    FUNCTION_FANSP: "fansp",
+    FUNCTION_AMBTEMP: "ambtemp",
+    FUNCTION_VANEUD: "vaneud",
+    FUNCTION_VANELR: "vanelr",
+    FUNCTION_ERRSTATUS: "errstatus",
+    FUNCTION_ERRCODE: "errcode",
+}
+
+# Reads every DeviceState slot in one call, in GET,1:* reply order.
+get_all_values = operator.attrgetter(*FUNCTION_TO_SLOT.values())
+
+
+class DeviceState:
+    """Current values of a single emulated AC unit."""
 
-class IntesisBoxEmulator(asyncio.Protocol):
+    __slots__ = tuple(FUNCTION_TO_SLOT.values())
+
+    def __init__(self):
+        """Start with the unit on, in auto mode."""
+        self.mode = MODE_AUTO
+        self.setpoint = b"210"
+        self.onoff = b"ON"
+        self.fansp = b"AUTO"
+        self.ambtemp = b"180"
+        self.vaneud = b"AUTO"
+        self.vanelr = b"AUTO"
+        self.errstatus = b"OK"
+        self.errcode = b""
+
+
+class IntesisBoxEmulator(asyncio.BufferedProtocol):
     """Dummy device, for testing."""
 
     def __init__(self):
@@ -35,85 +95,183 @@ class IntesisBoxEmulator(asyncio.Protocol):
         self.mode = "AUTO"
         self.setpoint = "210"
         self.power = "ON"
-        self.devices = {
-            "1": {
-                FUNCTION_MODE: MODE_AUTO,
-                FUNCTION_SETPOINT: "210",
-                FUNCTION_ONOFF: "ON",
-                FUNCTION_FANSP: "AUTO",
-                FUNCTION_AMBTEMP: "180",
-                FUNCTION_VANEUD: "AUTO",
-                FUNCTION_VANELR: "AUTO",
-                FUNCTION_ERRSTATUS: "OK",
-                FUNCTION_ERRCODE: "",
-            }
+        self.devices = {b"1": DeviceState()}
+        # Every reply for a known function starts with the same bytes.
+        self._chn_prefix = {
+            (acNum, function): b"CHN," + acNum + b":" + function + b","
+            for acNum in self.devices
+            for function in FUNCTION_TO_SLOT
+        }
+        self._get_all_prefixes = {
+            acNum: [self._chn_prefix[acNum, function] for function in FUNCTION_TO_SLOT]
+            for acNum in self.devices
+        }
+        self._buf = bytearray(RECEIVE_BUFFER_SIZE)
+        self._view = memoryview(self._buf)
+        self._filled = 0
+        self._handlers = {
+            b"ID": self._handle_id,
+            b"GET": self._handle_get,
+            b"SET": self._handle_set,
+            b"LIMITS": self._handle_limits,
         }
 
     def connection_made(self, transport):
         """Store connection when setup."""
         self.transport = transport
+        # Replies are tiny, don't let Nagle hold them back.
+        sock = transport.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def get_buffer(self, sizehint):
+        """Hand the transport the unused tail of the receive buffer."""
+        if len(self._buf) - self._filled < max(sizehint, 1):
+            # A resize would fail while views are exported, so copy instead.
+            buf = bytearray(max(len(self._buf) * 2, self._filled + sizehint))
+            buf[: self._filled] = self._view[: self._filled]
+            self._buf = buf
+            self._view = memoryview(buf)
+        return self._view[self._filled :]
 
-    def data_received(self, data):
-        """Process received data."""
-        linesReceived = data.decode("ascii").splitlines()
-        for line in linesReceived:
-            request = line.rstrip().split(",")
-            response = ""
-            if request[0] == "ID":
-                response = (
-                    "ID:IS-IR-WMP-1,001DC9A2C911,192.168.100.246,ASCII,v0.0.1,-44"
+    def buffer_updated(self, nbytes):
+        """Process every complete line now held in the receive buffer."""
+        self._filled += nbytes
+        start = 0
+        out = []
+        while (end := self._find_eol(start)) >= 0:
+            if end > start:
+                self._process_line(self._view[start:end], out)
+            start = end + 1
+
+        if out:
+            # One write for every reply to this read.
+            self.transport.writelines(out)
+
+        if start:
+            # Move any partial line down to the front of the buffer.
+            remaining = self._filled - start
+            self._view[:remaining] = self._view[start : self._filled]
+            self._filled = remaining
+
+        if self._filled > MAX_LINE_LENGTH:
+            # No end of line in sight, so this isn't a command; stop buffering it.
+            self._filled = 0
+
+    def _find_eol(self, start):
+        """Return the offset of the next CR or LF, or -1 if there is none."""
+        cr = self._buf.find(b"\r", start, self._filled)
+        lf = self._buf.find(b"\n", start, self._filled)
+        if cr < 0 or 0 <= lf < cr:
+            return lf
+        return cr
+
+    def _process_line(self, line, out):
+        """Queue the reply to a single command line onto out."""
+        # Tokenize once, e.g. b"SET,1:MODE,COOL" -> [b"SET"], [b"1", b"MODE"], [b"COOL"]
+        head_parts = bytes(line).rstrip().split(b",", 2)
+        cmd_parts = head_parts[0].split(b":", 1)
+        arg_parts = head_parts[1].split(b":", 1) if len(head_parts) > 1 else []
+        handler = self._handlers.get(cmd_parts[0])
+        if handler:
+            handler(out, cmd_parts, arg_parts, head_parts[2:])
+        else:
+            out.append(b"\r\n")
+
+    def _handle_id(self, out, cmd_parts, arg_parts, values):
+        """Respond to ID."""
+        out.append(b"ID:IS-IR-WMP-1,001DC9A2C911,192.168.100.246,ASCII,v0.0.1,-44\r\n")
+
+    def _handle_get(self, out, cmd_parts, arg_parts, values):
+        """Respond to GET,<acNum>:<function>."""
+        if len(arg_parts) != 2:
+            out.append(ERR)
+            return
+        acNum, function = arg_parts
+        state = self.devices.get(acNum)
+        if state is None:
+            out.append(ERR)
+        elif function == b"*":
+            out.extend(
+                prefix + value + b"\r\n"
+                for prefix, value in zip(
+                    self._get_all_prefixes[acNum], get_all_values(state)
                 )
-            elif request[0] == "GET":
-                acNum = request[1].split(":")[0]
-                function = request[1].split(":")[1]
-                if acNum in self.devices and function == "*":
-                    for function, value in self.devices[acNum].items():
-                        response += f"CHN,{acNum}:{function},{value}\r\n"
-                elif acNum in self.devices and function in self.devices[acNum]:
-                    current_value = self.devices[acNum][function]
-                    response = f"CHN,{acNum}:{function},{current_value}"
-                else:
-                    response = "ERR"
-
-            elif request[0] == "SET":
-                acNum = request[1].split(":")[0]
-                function = request[1].split(":")[1]
-                if (
-                    acNum in self.devices
-                    and function in RW_FUNCTIONS
-                    and len(request) >= 3
-                ):
-                    value = request[2]
-                    if self.devices[acNum][function] != value:
-                        self.devices[acNum][function] = value
-                        response = f"ACK\r\nCHN,{acNum}:{function},{value}"
-                    else:
-                        response = "ACK"
-                else:
-                    response = "ERR"
-
-            elif request[0].split(":")[0] == "LIMITS":
-                limit = request[0].split(":")[1]
-                if limit == "FANSP":
-                    response = "LIMITS:FANSP,[AUTO,1,2,3,4]"
-                elif limit == "VANEUD":
-                    response = "LIMITS:VANEUD,[AUTO,1,2,3,SWING]"
-                elif limit == "VANELR":
-                    response = "LIMITS:VANELR,[AUTO,1,2,3,SWING]"
-                elif limit == "SETPTEMP":
-                    response = "LIMITS:SETPTEMP,[160,300]"
-                elif limit == "MODE":
-                    response = "LIMITS:MODE,[AUTO,HEAT,DRY,COOL,FAN]"
-
-            response += "\r\n"
-            self.transport.write(response.encode("ascii"))
-
-
-async def main(host, port):
+            )
+        elif (slot := FUNCTION_TO_SLOT.get(function)) is not None:
+            out.append(
+                self._chn_prefix[acNum, function] + getattr(state, slot) + b"\r\n"
+            )
+        else:
+            out.append(ERR)
+
+    def _handle_set(self, out, cmd_parts, arg_parts, values):
+        """Respond to SET,<acNum>:<function>,<value>."""
+        if len(arg_parts) != 2 or not values:
+            out.append(ERR)
+            return
+        acNum, function = arg_parts
+        if acNum not in self.devices or function not in RW_FUNCTIONS:
+            out.append(ERR)
+            return
+        value = values[0]
+        state = self.devices[acNum]
+        slot = FUNCTION_TO_SLOT[function]
+        if getattr(state, slot) != value:
+            setattr(state, slot, value)
+            out.append(ACK + self._chn_prefix[acNum, function] + value + b"\r\n")
+        else:
+            out.append(ACK)
+
+    def _handle_limits(self, out, cmd_parts, arg_parts, values):
+        """Respond to LIMITS:<function>."""
+        limit = cmd_parts[1] if len(cmd_parts) > 1 else b""
+        out.append(LIMITS_RESPONSES.get(limit, b"\r\n"))
+
+
+async def main(host, port, reuse_port=False):
     """Set up and run the emulator."""
     loop = asyncio.get_running_loop()
-    server = await loop.create_server(IntesisBoxEmulator, host, port)
+    server = await loop.create_server(
+        IntesisBoxEmulator, host, port, reuse_port=reuse_port or None
+    )
     await server.serve_forever()
 
 
-asyncio.run(main("0.0.0.0", 3310))
+def run_worker(host, port, reuse_port):
+    """Run one emulator process."""
+    asyncio.run(main(host, port, reuse_port))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=3310)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="processes sharing the port via SO_REUSEPORT, for load testing",
+    )
+    args = parser.parse_args()
+
+    if args.workers <= 1:
+        run_worker(args.host, args.port, False)
+    else:
+        # The kernel spreads incoming connections across the workers.
+        workers = [
+            multiprocessing.Process(
+                target=run_worker, args=(args.host, args.port, True), daemon=True
+            )
+            for _ in range(args.workers)
+        ]
+        for worker in workers:
+            worker.start()
+        # Make SIGTERM unwind like Ctrl+C so the workers are not orphaned.
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+        try:
+            for worker in workers:
+                worker.join()
+        except KeyboardInterrupt:
+            for worker in workers:
+                worker.terminate()
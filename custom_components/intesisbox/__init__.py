@@ -1,27 +1,55 @@
 """IntesisBox Climate Platform."""
 
 import asyncio
+import contextlib
+import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType
+
+from .intesisbox import IntesisBox
+
+_LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "intesisbox"
 PLATFORMS = ["climate"]
 
+# Seconds to wait for the device to report its ID, modes and fan speeds.
+SETUP_TIMEOUT = 15
+# Seconds to wait for the climate platform to finish setting up.
+PLATFORM_SETUP_TIMEOUT = 30
+# Seconds to wait for the socket to close when unloading.
+DISCONNECT_TIMEOUT = 5
+# hass.data key of the config flow's cache of recent successful probes.
+PROBE_CACHE = f"{DOMAIN}_probe"
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the IntesisBox component."""
+    hass.data[DOMAIN] = {}
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Load the saved entities."""
     host = entry.data[CONF_HOST]
 
-    from . import intesisbox
+    controller = IntesisBox(host, loop=hass.loop)
+    try:
+        await controller.async_connect(SETUP_TIMEOUT)
+    except asyncio.CancelledError:
+        controller.stop()
+        raise
+    except TimeoutError as exc:
+        controller.stop()
+        raise ConfigEntryNotReady(f"Timed out connecting to IntesisBox {host}") from exc
 
-    controller = intesisbox.IntesisBox(host, loop=hass.loop)
-    controller.connect()
-    while not controller.is_connected:
-        await asyncio.sleep(0.1)
-
-    hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = controller
 
     if entry.unique_id is None:
@@ -29,13 +57,45 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             entry, unique_id=controller.device_mac_address
         )
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Cancelled by Home Assistant when the entry is unloaded.
+    entry.async_create_background_task(
+        hass, controller.async_maintain_connection(), f"intesisbox {host}"
+    )
+
+    try:
+        async with asyncio.timeout(PLATFORM_SETUP_TIMEOUT):
+            await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    except TimeoutError as exc:
+        hass.data[DOMAIN].pop(entry.entry_id)
+        controller.stop()
+        # The platform may already be set up; unload it so the retry can set it up.
+        try:
+            await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error unloading the partly set up IntesisBox %s", host)
+        raise ConfigEntryNotReady("Climate platform setup timed out") from exc
+    _LOGGER.debug("IntesisBox %s (%s) set up", host, controller.device_mac_address)
 
     return True
 
 
-async def async_unload_entry(hass, entry):
+async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    controller = hass.data[DOMAIN][entry.entry_id]
-    controller.stop()
+    _forget_probe(hass, entry)
+    controller = hass.data[DOMAIN].pop(entry.entry_id, None)
+    if controller:
+        controller.stop()
+        # Make sure the socket is gone before a reload reconnects.
+        with contextlib.suppress(TimeoutError):
+            await controller.wait_for_disconnect(DISCONNECT_TIMEOUT)
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget a removed entry's cached probe."""
+    _forget_probe(hass, entry)
+
+
+def _forget_probe(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the config flow's cached probe of the entry's host."""
+    hass.data.get(PROBE_CACHE, {}).pop(entry.data[CONF_HOST], None)
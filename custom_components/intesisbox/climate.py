@@ -18,7 +18,11 @@ from homeassistant.components.climate import (
     ClimateEntityFeature,
     HVACMode,
 )
-from homeassistant.components.climate.const import ATTR_HVAC_MODE
+from homeassistant.components.climate.const import (
+    ATTR_HVAC_MODE,
+    DEFAULT_MAX_TEMP,
+    DEFAULT_MIN_TEMP,
+)
 from homeassistant.const import (
     ATTR_TEMPERATURE,
     CONF_HOST,
@@ -27,16 +31,21 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     UnitOfTemperature,
 )
+from homeassistant.core import callback
 from homeassistant.exceptions import PlatformNotReady
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.debounce import Debouncer
 
-from . import DOMAIN
+from . import DOMAIN, SETUP_TIMEOUT
 from .intesisbox import IntesisBox
 
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_NAME = "Intesisbox"
 
+# Seconds over which bursts of pushed updates are merged into one state write.
+PUSH_COOLDOWN = 0.2
+
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
         vol.Required(CONF_HOST): cv.string,
@@ -74,7 +83,6 @@ FAN_MODE_I_TO_E = {
     "2": "medium",
     "3": "high",
 }
-FAN_MODE_E_TO_I = {v: k for k, v in FAN_MODE_I_TO_E.items()}
 
 SWING_ON = "SWING"
 SWING_STOP = "AUTO"
@@ -83,15 +91,38 @@ SWING_LIST_VERTICAL = "Vertical"
 SWING_LIST_BOTH = "Both"
 SWING_LIST_STOP = "Auto"
 
+# (vertical swinging, horizontal swinging) <-> swing mode.
+MAP_SWING_TO_HA = {
+    (True, True): SWING_LIST_BOTH,
+    (True, False): SWING_LIST_VERTICAL,
+    (False, True): SWING_LIST_HORIZONTAL,
+    (False, False): SWING_LIST_STOP,
+}
+MAP_SWING_TO_VANES = {
+    mode: (
+        SWING_ON if vertical else SWING_STOP,
+        SWING_ON if horizontal else SWING_STOP,
+    )
+    for (vertical, horizontal), mode in MAP_SWING_TO_HA.items()
+}
+
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Create the Intesisbox climate devices."""
-    from . import intesisbox
-
-    controller = intesisbox.IntesisBox(config[CONF_HOST], loop=hass.loop)
-    controller.connect()
-    while not controller.is_connected:
-        await asyncio.sleep(0.1)
+    controller = IntesisBox(config[CONF_HOST], loop=hass.loop)
+    try:
+        await controller.async_connect(SETUP_TIMEOUT)
+    except asyncio.CancelledError:
+        controller.stop()
+        raise
+    except TimeoutError as exc:
+        controller.stop()
+        raise PlatformNotReady(
+            f"Timed out connecting to IntesisBox {config[CONF_HOST]}"
+        ) from exc
+    hass.async_create_background_task(
+        controller.async_maintain_connection(), f"intesisbox {config[CONF_HOST]}"
+    )
 
     name = config.get(CONF_NAME)
     unique_id = config.get(CONF_UNIQUE_ID)
@@ -124,29 +155,47 @@ class IntesisBoxAC(ClimateEntity):
         # Disable compatibility mode until 2025.1 as per https://developers.home-assistant.io/blog/2024/01/24/climate-climateentityfeatures-expanded/
         self._enable_turn_on_off_backwards_compatibility = False
 
-        self._max_temp = controller.max_setpoint
-        self._min_temp = controller.min_setpoint
+        self._max_temp = controller.max_setpoint or DEFAULT_MAX_TEMP
+        self._min_temp = controller.min_setpoint or DEFAULT_MIN_TEMP
         self._target_temperature = None
+        # What HA is shown, derived once per update rather than per read.
+        self._hvac_mode = HVACMode.OFF
+        self._shown_target_temperature = None
         self._current_temp = None
         self._rssi = None
-        self._swing_list = []
+        self._swing_list: list[str] = []
         self._vswing = False
         self._hswing = False
+        self._swing_mode = SWING_LIST_STOP
         self._power = False
         self._current_operation = STATE_UNKNOWN
         self._connection_retries = 0
-        self._has_swing_control = self._controller.has_swing_control
+        # Set until the controller's state has been copied; polls with
+        # nothing new are skipped.
+        self._pending_push = True
+        self._last_state: tuple | None = None
+        self._push_debouncer: Debouncer | None = None
+        self._has_swing_control = False
+        self._vane_vertical_list: list[str] | None = None
+        self._vane_horizontal_list: list[str] | None = None
 
         # Setup fan list
-        self._fan_list = [x.title() for x in self._controller.fan_speed_list]
-        if len(self._fan_list) < 1:
+        # Keyed by the exact strings the device reports and HA sends back.
+        self._fan_mode_by_speed = {
+            speed: FAN_MODE_I_TO_E.get(speed, speed.lower())
+            for speed in self._controller.fan_speed_list
+        }
+        self._speed_by_fan_mode = {v: k for k, v in self._fan_mode_by_speed.items()}
+        self._fan_modes = list(self._fan_mode_by_speed.values())
+        if len(self._fan_modes) < 1:
             raise PlatformNotReady("Controller hasn't finished initializing device")
-        self._fan_speed = None
+        self._fan_mode = None
 
         # Setup operation list
-        self._operation_list = [HVACMode.OFF]
-        for operation in self._controller.operation_list:
-            self._operation_list.append(MAP_OPERATION_MODE_TO_HA[operation])
+        self._operation_list = (HVACMode.OFF,) + tuple(
+            MAP_OPERATION_MODE_TO_HA[operation]
+            for operation in self._controller.operation_list
+        )
         if len(self._operation_list) == 1:
             raise PlatformNotReady
 
@@ -156,23 +205,38 @@ class IntesisBoxAC(ClimateEntity):
         self._base_features |= ClimateEntityFeature.TURN_ON
         self._base_features |= ClimateEntityFeature.TURN_OFF
 
-        if len(self._fan_list) > 0:
+        if len(self._fan_modes) > 0:
             self._base_features |= ClimateEntityFeature.FAN_MODE
 
-        # Setup swing control
+        self._update_swing_control()
+
+        _LOGGER.debug("Finished setting up climate entity!")
+        self._controller.add_update_callback(self.update_callback)
+
+    def _update_swing_control(self):
+        """Set up swing modes from the vane limits, which may arrive late."""
+        vertical = self._controller.vane_vertical_list
+        horizontal = self._controller.vane_horizontal_list
+        if (
+            vertical is self._vane_vertical_list
+            and horizontal is self._vane_horizontal_list
+        ):
+            return
+        self._vane_vertical_list = vertical
+        self._vane_horizontal_list = horizontal
+
+        self._has_swing_control = self._controller.has_swing_control
+        self._swing_list = []
         if self._has_swing_control:
             self._base_features |= ClimateEntityFeature.SWING_MODE
             self._swing_list = [SWING_LIST_STOP]
-            if SWING_ON in self._controller.vane_horizontal_list:
+            if SWING_ON in horizontal:
                 self._swing_list.append(SWING_LIST_HORIZONTAL)
-            if SWING_ON in self._controller.vane_vertical_list:
+            if SWING_ON in vertical:
                 self._swing_list.append(SWING_LIST_VERTICAL)
             if len(self._swing_list) > 2:
                 self._swing_list.append(SWING_LIST_BOTH)
 
-        _LOGGER.debug("Finished setting up climate entity!")
-        self._controller.add_update_callback(self.update_callback)
-
     @property
     def name(self):
         """Return the name of the AC device."""
@@ -207,7 +271,7 @@ class IntesisBoxAC(ClimateEntity):
             attrs["vertical_swing"] = self._vswing
             attrs["horizontal_swing"] = self._hswing
 
-        if self._controller.is_connected:
+        if self._connected:
             attrs["ha_update_type"] = "push"
         else:
             attrs["ha_update_type"] = "poll"
@@ -216,7 +280,7 @@ class IntesisBoxAC(ClimateEntity):
 
     def set_temperature(self, **kwargs):
         """Set new target temperature."""
-        _LOGGER.debug(f"set_temperature({kwargs!r})")
+        _LOGGER.debug("set_temperature(%r)", kwargs)
 
         temperature = kwargs.get(ATTR_TEMPERATURE)
         operation_mode = kwargs.get(ATTR_HVAC_MODE)
@@ -229,10 +293,14 @@ class IntesisBoxAC(ClimateEntity):
 
     def set_hvac_mode(self, operation_mode):
         """Set operation mode."""
-        _LOGGER.debug(f"set_hvac_mode({operation_mode=})")
+        _LOGGER.debug("set_hvac_mode(operation_mode=%r)", operation_mode)
         if operation_mode == HVACMode.OFF:
             self._controller.set_power_off()
             self._power = False
+            self._hvac_mode = HVACMode.OFF
+            self._shown_target_temperature = None
+            # Shown optimistically; make the next push write the real state.
+            self._last_state = None
         else:
             self._controller.set_mode(MAP_OPERATION_MODE_TO_IB[operation_mode])
 
@@ -240,12 +308,12 @@ class IntesisBoxAC(ClimateEntity):
             if self._target_temperature:
                 self._controller.set_temperature(self._target_temperature)
 
-        self.hass.async_add_job(self.schedule_update_ha_state, False)
+        self.schedule_update_ha_state()
 
     def turn_on(self):
         """Turn thermostat on."""
         self._controller.set_power_on()
-        self.hass.async_add_job(self.schedule_update_ha_state, False)
+        self.schedule_update_ha_state()
 
     def turn_off(self):
         """Turn thermostat off."""
@@ -253,56 +321,69 @@ class IntesisBoxAC(ClimateEntity):
 
     def set_fan_mode(self, fan_mode):
         """Set fan mode (from quiet, low, medium, high, auto)."""
-        target = FAN_MODE_E_TO_I.get(fan_mode, fan_mode)
+        target = self._speed_by_fan_mode.get(fan_mode, fan_mode.upper())
         _LOGGER.debug(
-            f"set_fan_mode({fan_mode=}) -> set_fan_speed(target={target.upper()})"
+            "set_fan_mode(fan_mode=%r) -> set_fan_speed(target=%r)", fan_mode, target
         )
-        self._controller.set_fan_speed(target.upper())
+        self._controller.set_fan_speed(target)
 
     def set_swing_mode(self, swing_mode):
         """Set the vertical vane."""
-        if swing_mode == SWING_LIST_BOTH:
-            self._controller.set_vertical_vane(SWING_ON)
-            self._controller.set_horizontal_vane(SWING_ON)
-        elif swing_mode == SWING_LIST_STOP:
-            self._controller.set_vertical_vane(SWING_STOP)
-            self._controller.set_horizontal_vane(SWING_STOP)
-        elif swing_mode == SWING_LIST_HORIZONTAL:
-            self._controller.set_vertical_vane(SWING_STOP)
-            self._controller.set_horizontal_vane(SWING_ON)
-        elif swing_mode == SWING_LIST_VERTICAL:
-            self._controller.set_vertical_vane(SWING_ON)
-            self._controller.set_horizontal_vane(SWING_STOP)
+        vanes = MAP_SWING_TO_VANES.get(swing_mode)
+        if vanes:
+            self._controller.set_vertical_vane(vanes[0])
+            self._controller.set_horizontal_vane(vanes[1])
 
     async def async_update(self):
         """Copy values from controller dictionary to climate device."""
+        # The controller reconnects on its own; just track how long it's been down.
         if not self._controller.is_connected:
-            await asyncio.sleep(
-                60
-            )  # per device specs, wait min 1 sec before re-connecting
-            await self.hass.async_add_executor_job(self._controller.connect)
-            self._connection_retries += 1
+            # Only whether it has reached 2 matters, see available.
+            self._connection_retries = min(self._connection_retries + 1, 2)
         else:
             self._connection_retries = 0
-
-        self._power = self._controller.is_on
-        self._current_temp = self._controller.ambient_temperature
-        self._min_temp = self._controller.min_setpoint
-        self._max_temp = self._controller.max_setpoint
-        self._target_temperature = self._controller.setpoint
-
-        if self._controller.fan_speed:
-            self._fan_speed = self._controller.fan_speed.title()
+            if not self._pending_push and self._connected:
+                return
+        self._update_from_controller()
+
+    def _update_from_controller(self) -> bool:
+        """Copy the controller's state, returning True if anything visible changed."""
+        self._pending_push = False
+        self._update_swing_control()
+
+        (
+            self._power,
+            self._current_temp,
+            min_setpoint,
+            max_setpoint,
+            self._target_temperature,
+            fan_speed,
+            ib_mode,
+            vertical_swing,
+            horizontal_swing,
+        ) = self._controller.snapshot()
+        if min_setpoint is not None:
+            self._min_temp = min_setpoint
+        if max_setpoint is not None:
+            self._max_temp = max_setpoint
+
+        if fan_speed:
+            self._fan_mode = self._fan_mode_by_speed.get(fan_speed, fan_speed.lower())
 
         # Operation mode
-        ib_mode = self._controller.mode
         self._current_operation = MAP_OPERATION_MODE_TO_HA.get(ib_mode, STATE_UNKNOWN)
+        self._hvac_mode = self._current_operation if self._power else HVACMode.OFF
+        if self._hvac_mode in (HVACMode.FAN_ONLY, HVACMode.OFF):
+            self._shown_target_temperature = None
+        else:
+            self._shown_target_temperature = self._target_temperature
 
         # Swing mode
         # Climate module only supports one swing setting.
         if self._has_swing_control:
-            self._vswing = self._controller.vertical_swing == SWING_ON
-            self._hswing = self._controller.horizontal_swing == SWING_ON
+            self._vswing = vertical_swing == SWING_ON
+            self._hswing = horizontal_swing == SWING_ON
+            self._swing_mode = MAP_SWING_TO_HA[self._vswing, self._hswing]
 
         # Track connection lost/restored.
         if self._connected != self._controller.is_connected:
@@ -312,8 +393,43 @@ class IntesisBoxAC(ClimateEntity):
             else:
                 _LOGGER.debug("Lost connection to Intesisbox.")
 
+        state = (
+            self._power,
+            self._current_temp,
+            self._min_temp,
+            self._max_temp,
+            self._target_temperature,
+            self._fan_mode,
+            self._current_operation,
+            self._swing_mode,
+            self._vswing,
+            self._hswing,
+            self._connected,
+            self._base_features,
+            tuple(self._swing_list),
+        )
+        if state == self._last_state:
+            return False
+        self._last_state = state
+        return True
+
+    async def async_added_to_hass(self):
+        """Start merging pushed updates once the entity is registered."""
+        self._push_debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=PUSH_COOLDOWN,
+            immediate=True,
+            function=self._async_write_pushed_state,
+        )
+        if self._pending_push:
+            self._push_debouncer.async_schedule_call()
+
     async def async_will_remove_from_hass(self):
         """Shutdown the controller when the device is being removed."""
+        if self._push_debouncer:
+            self._push_debouncer.async_cancel()
+            self._push_debouncer = None
         self._controller.stop()
 
     @property
@@ -327,8 +443,15 @@ class IntesisBoxAC(ClimateEntity):
     def update_callback(self):
         """Let HA know there has been an update from the controller."""
         _LOGGER.debug("Intesisbox sent a status update.")
-        if self.hass:
-            self.hass.async_add_job(self.schedule_update_ha_state, True)
+        self._pending_push = True
+        if self._push_debouncer:
+            self._push_debouncer.async_schedule_call()
+
+    @callback
+    def _async_write_pushed_state(self):
+        """Copy pushed values and write them if anything visible changed."""
+        if self._update_from_controller():
+            self.async_write_ha_state()
 
     @property
     def min_temp(self):
@@ -360,24 +483,17 @@ class IntesisBoxAC(ClimateEntity):
     @property
     def fan_mode(self):
         """Return whether the fan is on."""
-        return FAN_MODE_I_TO_E.get(self._fan_speed, self._fan_speed).lower()
+        return self._fan_mode
 
     @property
     def swing_mode(self):
         """Return current swing mode."""
-        if self._vswing and self._hswing:
-            return SWING_LIST_BOTH
-        elif self._vswing:
-            return SWING_LIST_VERTICAL
-        elif self._hswing:
-            return SWING_LIST_HORIZONTAL
-        else:
-            return SWING_LIST_STOP
+        return self._swing_mode
 
     @property
     def fan_modes(self):
         """List of available fan modes."""
-        return [FAN_MODE_I_TO_E.get(mode.upper(), mode) for mode in self._fan_list]
+        return self._fan_modes
 
     @property
     def swing_modes(self):
@@ -402,16 +518,12 @@ class IntesisBoxAC(ClimateEntity):
     @property
     def hvac_mode(self):
         """Return the current mode of operation if unit is on."""
-        if self._power:
-            return self._current_operation
-        return HVACMode.OFF
+        return self._hvac_mode
 
     @property
     def target_temperature(self):
         """Return the current setpoint temperature if unit is on and not FAN or OFF Mode."""
-        if self._power and self.hvac_mode not in [HVACMode.FAN_ONLY, HVACMode.OFF]:
-            return self._target_temperature
-        return None
+        return self._shown_target_temperature
 
     @property
     def supported_features(self):
@@ -1,16 +1,70 @@
 """Config flow to configure the Intesisbox integration."""
 
+import asyncio
 import logging
 
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 
-from . import DOMAIN
+from . import DOMAIN, PROBE_CACHE
+from .intesisbox import IntesisBox
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds to wait for the device to report its ID, modes and fan speeds.
+CONNECTION_TIMEOUT = 10
+# Seconds a successful probe of a host is reused by later flows.
+PROBE_CACHE_TTL = 30
+PROBE_INFLIGHT = f"{DOMAIN}_probe_inflight"
+
+USER_SCHEMA = vol.Schema({vol.Required(CONF_HOST): str})
+
+
+class CannotConnect(HomeAssistantError):
+    """Error to indicate the device could not be reached."""
+
+
+async def validate_connection(hass: HomeAssistant, host: str) -> dict[str, str]:
+    """Connect to the device and return its details."""
+    async with IntesisBox(host, loop=hass.loop) as controller:
+        try:
+            await controller.async_connect(CONNECTION_TIMEOUT)
+        except TimeoutError as exc:
+            raise CannotConnect(f"Timed out connecting to IntesisBox {host}") from exc
+        mac = controller.device_mac_address
+        if not mac:
+            raise CannotConnect(f"IntesisBox {host} did not report a MAC address")
+        return {"mac": mac}
+
+
+async def _probe(hass: HomeAssistant, host: str) -> dict[str, str]:
+    """Validate the host, reusing a recent successful result."""
+    cache: dict[str, tuple[float, dict[str, str]]] = hass.data.setdefault(
+        PROBE_CACHE, {}
+    )
+    now = hass.loop.time()
+    for expired in [h for h, (expires, _) in cache.items() if expires <= now]:
+        del cache[expired]
+    if host in cache:
+        return cache[host][1]
+
+    # Flows probing the same host at the same time share one connection.
+    inflight: dict[str, asyncio.Task] = hass.data.setdefault(PROBE_INFLIGHT, {})
+    task = inflight.get(host)
+    if task is None:
+        task = hass.async_create_task(validate_connection(hass, host))
+        inflight[host] = task
+        task.add_done_callback(lambda _: inflight.pop(host, None))
+
+    # Shielded so one flow going away doesn't cancel the others' probe.
+    info = await asyncio.shield(task)
+    cache[host] = (hass.loop.time() + PROBE_CACHE_TTL, info)
+    return info
+
 
 class IntesisboxFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):  # type:ignore
     """Handle a config flow."""
@@ -24,16 +78,13 @@ class IntesisboxFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):  # type:i
     def _show_setup_form(self, user_input=None, errors=None):
         """Show the setup form to the user."""
 
-        if user_input is None:
-            user_input = {}
+        data_schema = USER_SCHEMA
+        if user_input:
+            data_schema = self.add_suggested_values_to_schema(data_schema, user_input)
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_HOST, default=user_input.get(CONF_HOST, "")): str,
-                }
-            ),
+            data_schema=data_schema,
             errors=errors or {},
         )
 
@@ -46,9 +97,15 @@ class IntesisboxFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):  # type:i
 
         self._host = user_input[CONF_HOST]
 
+        try:
+            info = await _probe(self.hass, self._host)
+        except CannotConnect:
+            errors["base"] = "cannot_connect"
+            return self._show_setup_form(user_input, errors)
+
         # Check if already configured
-        # await self.async_set_unique_id(self._host)
-        # self._abort_if_unique_id_configured()
+        await self.async_set_unique_id(info["mac"])
+        self._abort_if_unique_id_configured(updates={CONF_HOST: self._host})
 
         return self.async_create_entry(
             title=self._host,
@@ -3,9 +3,15 @@
 from __future__ import annotations
 
 import asyncio
-from asyncio import BaseTransport, ensure_future
+from asyncio import BaseTransport, Transport
+from collections import deque
 from collections.abc import Callable
+import contextlib
+import heapq
 import logging
+import random
+import time
+from typing import cast
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,7 +28,7 @@ MODE_DRY = "DRY"
 MODE_FAN = "FAN"
 MODE_COOL = "COOL"
 MODE_HEAT = "HEAT"
-MODES = [MODE_AUTO, MODE_DRY, MODE_FAN, MODE_COOL, MODE_HEAT]
+MODES = frozenset((MODE_AUTO, MODE_DRY, MODE_FAN, MODE_COOL, MODE_HEAT))
 
 FUNCTION_ONOFF = "ONOFF"
 FUNCTION_MODE = "MODE"
@@ -34,21 +40,155 @@ FUNCTION_AMBTEMP = "AMBTEMP"
 FUNCTION_ERRSTATUS = "ERRSTATUS"
 FUNCTION_ERRCODE = "ERRCODE"
 
-NULL_VALUES = ["-32768", "32768"]
+NULL_VALUES = frozenset(("-32768", "32768"))
+
+# Client attribute holding the allowed values for each LIMITS function.
+LIMIT_ATTRS = {
+    FUNCTION_FANSP: "_fan_speed_list",
+    FUNCTION_MODE: "_operation_list",
+    FUNCTION_VANEUD: "_vertical_vane_list",
+    FUNCTION_VANELR: "_horizontal_vane_list",
+}
+
+# Functions reported in tenths of a degree, kept as ints in _temperatures.
+NUMERIC_FUNCTIONS = frozenset((FUNCTION_SETPOINT, FUNCTION_AMBTEMP))
+
+# Encoded "SET,1:FUNCTION," prefix for each writable function.
+SET_PREFIX = {
+    function: f"SET,1:{function},".encode("ascii")
+    for function in (
+        FUNCTION_ONOFF,
+        FUNCTION_MODE,
+        FUNCTION_SETPOINT,
+        FUNCTION_FANSP,
+        FUNCTION_VANEUD,
+        FUNCTION_VANELR,
+    )
+}
+
+# Fixed commands, encoded once.
+CMD_GET_AMBTEMP = b"GET,1:AMBTEMP\r"
+CMD_GET_ALL = b"GET,1:*\r"
+CMD_GET_MODE = b"GET,1:MODE\r"
+CMD_POWER_ON = SET_PREFIX[FUNCTION_ONOFF] + POWER_ON.encode("ascii") + b"\r"
+INITIAL_QUERY = (
+    b"ID\r",
+    b"LIMITS:SETPTEMP\r",
+    b"LIMITS:FANSP\r",
+    b"LIMITS:MODE\r",
+    b"LIMITS:VANEUD\r",
+    b"LIMITS:VANELR\r",
+)
+
+# Send the whole initial query in one write. Set to False for devices that
+# can't take several commands back to back; they then go out a second apart.
+BATCH_INITIAL_QUERY = True
+
+# Seconds between AMBTEMP queries, and how long the device may stay silent
+# before the connection is considered dead and closed.
+AMBTEMP_POLL_INTERVAL = 10
+AMBTEMP_TIMEOUT = 30
+
+# Seconds between full state queries, since the device doesn't always push changes.
+STATUS_POLL_INTERVAL = 300
+
+# Drop unterminated input beyond this many bytes; no WMP line is this long.
+MAX_LINE_LENGTH = 1024
+
+# Transport buffer limits in bytes. While the buffer is above the high mark
+# polls are dropped and up to WRITE_HELD_MAX SET commands are held back.
+WRITE_BUFFER_HIGH = 4096
+WRITE_BUFFER_LOW = 1024
+WRITE_HELD_MAX = 8
+
+# Seconds to gather state changes before notifying listeners, so a burst of
+# lines spread over several reads produces one update.
+UPDATE_CALLBACK_DELAY = 0.05
+
+# Minimum seconds between SET commands; units drop commands sent too quickly.
+COMMAND_INTERVAL = 1
+
+# Seconds to wait for a new mode to be confirmed before powering on, and
+# between MODE queries while waiting.
+MODE_SET_TIMEOUT = 30
+MODE_QUERY_INTERVAL = 1
+
+# Per the WMP spec, wait at least a second before reconnecting.
+RECONNECT_MIN_DELAY = 1
+
+# Monotonic time each (host, port) was last disconnected, shared by every
+# client so a reload or a config flow probe also keeps the gap.
+_LAST_DISCONNECT: dict[tuple[str, int], float] = {}
+
+# Seconds between connection attempts, doubling after each failure, plus
+# up to 50% random jitter.
+CONNECT_BACKOFF_INITIAL = 1
+CONNECT_BACKOFF_MAX = 300
+CONNECT_BACKOFF_JITTER = 0.5
+# Failed attempts after which an unreachable device is reported once.
+CONNECT_FAILURES_WARNING = 10
+# Seconds to wait for the socket to close when leaving an `async with` block.
+CLOSE_TIMEOUT = 5
+# Seconds a reconnected device may take to finish the handshake.
+RECONNECT_READY_TIMEOUT = 60
 
 
 class IntesisBox(asyncio.Protocol):
     """Handles communication with an intesisbox device via WMP."""
 
+    __slots__ = (
+        "_ip",
+        "_port",
+        "_mac",
+        "_device",
+        "_temperatures",
+        "_connectionStatus",
+        "_transport",
+        "_updateCallbacks",
+        "_update_pending",
+        "_errorCallbacks",
+        "_errorMessage",
+        "_controllerType",
+        "_model",
+        "_firmversion",
+        "_rssi",
+        "_eventLoop",
+        "_ready_event",
+        "_disconnected_event",
+        "_stopped",
+        "_connect_delay",
+        "_connect_failures",
+        "_write_lock",
+        "_last_command",
+        "_tasks",
+        "_pending",
+        "_paused",
+        "_held",
+        "_mode_change_event",
+        "_mode_change_target",
+        "_last_rx",
+        "_scheduler_task",
+        "_rxbuf",
+        "_handlers",
+        "_operation_list",
+        "_fan_speed_list",
+        "_vertical_vane_list",
+        "_horizontal_vane_list",
+        "_setpoint_minimum",
+        "_setpoint_maximum",
+    )
+
     def __init__(self, ip: str, port: int = 3310, loop=None):
         """Set up base state."""
         self._ip = ip
         self._port = port
         self._mac = None
-        self._device: dict[str, str] = {}
+        self._device: dict[str, str | None] = {}
+        self._temperatures: dict[str, int | None] = {}
         self._connectionStatus = API_DISCONNECTED
-        self._transport: BaseTransport | None = None
+        self._transport: Transport | None = None
         self._updateCallbacks: list[Callable[[], None]] = []
+        self._update_pending = False
         self._errorCallbacks: list[Callable[[str], None]] = []
         self._errorMessage: str | None = None
         self._controllerType = None
@@ -56,90 +196,208 @@ class IntesisBox(asyncio.Protocol):
         self._firmversion: str | None = None
         self._rssi: int | None = None
         self._eventLoop = loop
+        self._ready_event = asyncio.Event()
+        self._disconnected_event = asyncio.Event()
+        self._disconnected_event.set()
+        self._stopped = False
+        self._connect_delay = CONNECT_BACKOFF_INITIAL
+        self._connect_failures = 0
+        self._write_lock = asyncio.Lock()
+        self._last_command: float | None = None
+        self._tasks: set[asyncio.Task] = set()
+        # Commands written in the same loop iteration are sent together.
+        self._pending: list[bytes] = []
+        # Set while the transport buffer is full, see pause_writing().
+        self._paused = False
+        self._held: deque[bytes] = deque(maxlen=WRITE_HELD_MAX)
+        self._mode_change_event = asyncio.Event()
+        self._mode_change_target: str | None = None
+        # Loop time of the last received line, so the scheduler can spot a dead link.
+        self._last_rx = 0.0
+        self._scheduler_task: asyncio.Task | None = None
+        # Bytes received after the last complete line.
+        self._rxbuf = bytearray()
+        self._handlers = {
+            b"ID": self._handle_id,
+            b"CHN,1": self._handle_change,
+            b"LIMITS": self._handle_limits,
+        }
 
         # Limits
         self._operation_list: list[str] = []
         self._fan_speed_list: list[str] = []
         self._vertical_vane_list: list[str] = []
         self._horizontal_vane_list: list[str] = []
-        self._setpoint_minimum: int | None = None
-        self._setpoint_maximum: int | None = None
+        self._setpoint_minimum: float | None = None
+        self._setpoint_maximum: float | None = None
 
     def connection_made(self, transport: BaseTransport):
         """Asyncio callback for a successful connection."""
         _LOGGER.debug("Connected to IntesisBox")
-        self._transport = transport
-        _ = asyncio.ensure_future(self.query_initial_state())
-
-    async def keep_alive(self):
-        """Send a keepalive command to reset it's watchdog timer."""
-        while self.is_connected:
-            _LOGGER.debug("Sending keepalive")
-            self._write("PING")
-            await asyncio.sleep(45)
-        else:
-            _LOGGER.debug("Not connected, skipping keepalive")
-
-    async def poll_ambtemp(self):
-        """Retrieve Ambient Temperature to prevent integration timeouts."""
+        # create_connection() always hands us a read/write TCP transport.
+        self._transport = cast(Transport, transport)
+        self._transport.set_write_buffer_limits(WRITE_BUFFER_HIGH, WRITE_BUFFER_LOW)
+        self._paused = False
+        self._held.clear()
+        self._rxbuf = bytearray()
+        self._disconnected_event.clear()
+        self._create_task(self.query_initial_state())
+
+    async def _scheduler(self):
+        """Send the periodic queries and close the link if the device goes silent."""
+        loop = self._eventLoop
+        now = self._last_rx = loop.time()
+        # Entries are [deadline, command, interval]; commands due together
+        # are written in the same iteration and so go out in one send.
+        heap = [
+            [now, CMD_GET_AMBTEMP, AMBTEMP_POLL_INTERVAL],
+            [now, CMD_GET_ALL, STATUS_POLL_INTERVAL],
+        ]
+        heapq.heapify(heap)
         while self.is_connected:
-            _LOGGER.debug("Sending AMBTEMP")
-            self._write("GET,1:AMBTEMP")
-            await asyncio.sleep(10)
-        else:
-            _LOGGER.debug("Not connected, skipping Ambient Temp Request")
+            delay = heap[0][0] - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            now = loop.time()
+            if now - self._last_rx > AMBTEMP_TIMEOUT:
+                _LOGGER.warning(
+                    "IntesisBox %s:%s stopped answering, closing the connection",
+                    self._ip,
+                    self._port,
+                )
+                if self._transport:
+                    self._transport.close()
+                return
+            while heap[0][0] <= now:
+                _, cmd, interval = heap[0]
+                self._write_bytes(cmd)
+                heapq.heapreplace(heap, [now + interval, cmd, interval])
 
     async def query_initial_state(self):
         """Fetch configuration from the device upon connection."""
-        cmds = [
-            "ID",
-            "LIMITS:SETPTEMP",
-            "LIMITS:FANSP",
-            "LIMITS:MODE",
-            "LIMITS:VANEUD",
-            "LIMITS:VANELR",
-        ]
-        for cmd in cmds:
-            self._write(cmd)
-            await asyncio.sleep(1)
-
-    def _write(self, cmd):
-        self._transport.write(f"{cmd}\r".encode("ascii"))
-        _LOGGER.debug(f"Data sent: {cmd!r}")
-
-    async def _writeasync(self, cmd):
+        if BATCH_INITIAL_QUERY:
+            for cmd in INITIAL_QUERY:
+                self._write_bytes(cmd)
+            return
+        for i, cmd in enumerate(INITIAL_QUERY):
+            if i:
+                await asyncio.sleep(1)
+            self._write_bytes(cmd)
+
+    def _write_bytes(self, cmd: bytes):
+        """Queue an encoded, CR-terminated command for the next flush."""
+        if self._paused:
+            # Polls are repeated anyway; only SETs are worth keeping.
+            if cmd.startswith(b"SET"):
+                self._held.append(cmd)
+            _LOGGER.debug("Write buffer full, holding back %r", cmd)
+            return
+        if not self._pending:
+            self._eventLoop.call_soon(self._flush)
+        self._pending.append(cmd)
+
+    def _flush(self):
+        """Send every command queued since the last flush in one go."""
+        pending = self._pending
+        self._pending = []
+        if self._transport is None or self._transport.is_closing():
+            return
+        if len(pending) == 1:
+            self._transport.write(pending[0])
+        else:
+            self._transport.writelines(pending)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            for cmd in pending:
+                _LOGGER.debug("Data sent: %r", cmd)
+
+    def pause_writing(self):
+        """Asyncio callback when the transport buffer goes over the high mark."""
+        _LOGGER.debug("Write buffer full, pausing writes")
+        self._paused = True
+
+    def resume_writing(self):
+        """Asyncio callback when the transport buffer drains below the low mark."""
+        _LOGGER.debug("Write buffer drained, resuming writes")
+        self._paused = False
+        while self._held:
+            self._write_bytes(self._held.popleft())
+
+    async def _writeasync(self, cmd: bytes):
         """Async write to slow down commands and await response from units."""
-        self._transport.write(f"{cmd}\r".encode("ascii"))
-        _LOGGER.debug(f"Data sent: {cmd!r}")
-        await asyncio.sleep(1)
+        async with self._write_lock:
+            if self._last_command is not None:
+                wait = self._last_command + COMMAND_INTERVAL - self._eventLoop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            self._write_bytes(cmd)
+            self._last_command = self._eventLoop.time()
+
+    def _spawn(self, coro, done_callback=None) -> None:
+        """Run a coroutine on the controller's event loop from any thread."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._eventLoop:
+            self._create_task(coro, done_callback)
+        else:
+            self._eventLoop.call_soon_threadsafe(self._create_task, coro, done_callback)
+
+    def _create_task(self, coro, done_callback=None) -> asyncio.Task:
+        """Start a task on the event loop, keeping a reference until it's done."""
+        task = self._eventLoop.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        if done_callback:
+            task.add_done_callback(done_callback)
+        return task
 
     def data_received(self, data):
         """Asyncio callback when data is received on the socket."""
-        linesReceived = data.decode("ascii").splitlines()
+        self._rxbuf += data
+        lines = self._rxbuf.splitlines(keepends=True)
+        if lines and not lines[-1].endswith((b"\r", b"\n")):
+            # Keep a partial line until the rest of it arrives.
+            self._rxbuf = lines.pop()
+            if len(self._rxbuf) > MAX_LINE_LENGTH:
+                self._rxbuf = bytearray()
+        else:
+            self._rxbuf = bytearray()
         statusChanged = False
-
-        for line in linesReceived:
-            _LOGGER.debug(f"Data received: {line!r}")
-            cmdList = line.split(":", 1)
-            cmd = cmdList[0]
-            args = None
-            if len(cmdList) > 1:
-                args = cmdList[1]
-                if cmd == "ID":
-                    self._parse_id_received(args)
-                    self._connectionStatus = API_AUTHENTICATED
-                    _ = asyncio.ensure_future(self.poll_status())
-                    _ = asyncio.ensure_future(self.poll_ambtemp())
-                elif cmd == "CHN,1":
-                    self._parse_change_received(args)
-                    statusChanged = True
-                elif cmd == "LIMITS":
-                    self._parse_limits_received(args)
-                    statusChanged = True
+        if lines:
+            self._last_rx = self._eventLoop.time()
+
+        for line in lines:
+            line = line.rstrip(b"\r\n")
+            if not line:
+                continue
+            _LOGGER.debug("Data received: %r", line)
+            cmd, sep, args = line.partition(b":")
+            handler = self._handlers.get(bytes(cmd)) if sep else None
+            if handler and handler(args.decode("ascii")):
+                statusChanged = True
+
+        if not self._ready_event.is_set() and self.is_ready:
+            self._ready_event.set()
 
         if statusChanged:
             self._send_update_callback()
 
+    def _handle_id(self, args: str) -> bool:
+        self._parse_id_received(args)
+        self._connectionStatus = API_AUTHENTICATED
+        if self._scheduler_task is None or self._scheduler_task.done():
+            self._scheduler_task = self._create_task(self._scheduler())
+        return False
+
+    def _handle_change(self, args: str) -> bool:
+        self._parse_change_received(args)
+        return True
+
+    def _handle_limits(self, args: str) -> bool:
+        self._parse_limits_received(args)
+        return True
+
     def _parse_id_received(self, args):
         # ID:Model,MAC,IP,Protocol,Version,RSSI
         info = args.split(",")
@@ -150,55 +408,55 @@ class IntesisBox(asyncio.Protocol):
             self._rssi = info[5]
 
             _LOGGER.debug(
-                "Updated info:",
-                f"model:{self._model}",
-                f"mac:{self._mac}",
-                f"version:{self._firmversion}",
-                f"rssi:{self._rssi}",
+                "Updated info: model:%s mac:%s version:%s rssi:%s",
+                self._model,
+                self._mac,
+                self._firmversion,
+                self._rssi,
             )
 
     def _parse_change_received(self, args):
         function = args.split(",")[0]
-        value = args.split(",")[1]
+        value: str | None = args.split(",")[1]
         if value in NULL_VALUES:
             value = None
-        self._device[function] = value
+        if function in NUMERIC_FUNCTIONS:
+            try:
+                self._temperatures[function] = int(value) if value else None
+            except ValueError:
+                self._temperatures[function] = None
+        else:
+            self._device[function] = value
+        if function == FUNCTION_MODE and value == self._mode_change_target:
+            self._mode_change_event.set()
 
-        _LOGGER.debug(f"Updated state: {self._device!r}")
+        _LOGGER.debug("Updated state: %s=%s", function, value)
 
     def _parse_limits_received(self, args):
-        split_args = args.split(",", 1)
-
-        if len(split_args) == 2:
-            function = split_args[0]
-            values = split_args[1][1:-1].split(",")
-
-            if function == FUNCTION_SETPOINT and len(values) == 2:
+        # LIMITS:FUNCTION,[value,value,...]; the brackets are optional here.
+        function, sep, rest = args.partition(",")
+        if not sep:
+            return
+        values = rest.strip().strip("[]").split(",")
+
+        if function == FUNCTION_SETPOINT:
+            if len(values) == 2:
                 self._setpoint_minimum = int(values[0]) / 10
                 self._setpoint_maximum = int(values[1]) / 10
-            elif function == FUNCTION_FANSP:
-                self._fan_speed_list = values
-            elif function == FUNCTION_MODE:
-                self._operation_list = values
-            elif function == FUNCTION_VANEUD:
-                self._vertical_vane_list = values
-            elif function == FUNCTION_VANELR:
-                self._horizontal_vane_list = values
+        elif function in LIMIT_ATTRS:
+            setattr(self, LIMIT_ATTRS[function], values)
 
-            _LOGGER.debug(
-                "Updated limits: ",
-                f"{self._setpoint_minimum=}",
-                f"{self._setpoint_maximum=}",
-                f"{self._fan_speed_list=}",
-                f"{self._operation_list=}",
-                f"{self._vertical_vane_list=}",
-                f"{self._horizontal_vane_list=}",
-            )
-        return
+        _LOGGER.debug("Updated limits: %s=%s", function, values)
 
     def connection_lost(self, exc):
         """Asyncio callback for a lost TCP connection."""
         self._connectionStatus = API_DISCONNECTED
+        self._ready_event.clear()
+        self._disconnected_event.set()
+        _LAST_DISCONNECT[self._ip, self._port] = time.monotonic()
+        if self._scheduler_task is not None:
+            self._scheduler_task.cancel()
+            self._scheduler_task = None
         _LOGGER.info("The server closed the connection")
         self._send_update_callback()
 
@@ -210,13 +468,11 @@ class IntesisBox(asyncio.Protocol):
                 # Must poll to get the authentication token
                 if self._ip and self._port:
                     # Create asyncio socket
-                    coro = self._eventLoop.create_connection(
-                        lambda: self, self._ip, self._port
-                    )
+                    coro = self._open_connection()
                     _LOGGER.debug(
                         "Opening connection to IntesisBox %s:%s", self._ip, self._port
                     )
-                    _ = ensure_future(coro, loop=self._eventLoop)
+                    self._spawn(coro, self._connection_attempt_done)
                 else:
                     _LOGGER.debug("Missing IP address or port.")
                     self._connectionStatus = API_DISCONNECTED
@@ -227,23 +483,152 @@ class IntesisBox(asyncio.Protocol):
         else:
             _LOGGER.debug("connect() called but already connecting")
 
+    async def _open_connection(self):
+        """Open the socket, keeping the device's minimum gap after a disconnect."""
+        last_disconnect = _LAST_DISCONNECT.get((self._ip, self._port))
+        if last_disconnect is not None:
+            wait = RECONNECT_MIN_DELAY - (time.monotonic() - last_disconnect)
+            if wait > 0:
+                await asyncio.sleep(wait)
+        return await self._eventLoop.create_connection(
+            lambda: self, self._ip, self._port
+        )
+
+    def _connection_attempt_done(self, future: asyncio.Future) -> None:
+        """Allow connect() to be retried if the connection could not be opened."""
+        if future.cancelled() or future.exception() is not None:
+            _LOGGER.debug(
+                "Could not connect to IntesisBox %s:%s: %r",
+                self._ip,
+                self._port,
+                None if future.cancelled() else future.exception(),
+            )
+            self._connectionStatus = API_DISCONNECTED
+
+    async def async_connect(self, timeout: float | None) -> None:
+        """Connect and wait until ready, retrying with backoff until timeout.
+
+        With a timeout of None, connection attempts never give up and the
+        handshake may take up to RECONNECT_READY_TIMEOUT seconds. Returns
+        without connecting once stop() has been called.
+        """
+        deadline = None if timeout is None else self._eventLoop.time() + timeout
+        while True:
+            if self._stopped:
+                return
+            remaining = None if deadline is None else deadline - self._eventLoop.time()
+            self._connectionStatus = API_CONNECTING
+            try:
+                await asyncio.wait_for(self._open_connection(), remaining)
+            except OSError as exc:
+                # Includes TimeoutError, both from the deadline and from the
+                # kernel; only running out of time ends the attempts.
+                self._connectionStatus = API_DISCONNECTED
+                if deadline is not None and self._eventLoop.time() >= deadline:
+                    raise TimeoutError from exc
+                delay = self._connect_failed()
+                if deadline is not None and deadline - self._eventLoop.time() <= delay:
+                    raise TimeoutError from exc
+                _LOGGER.debug(
+                    "Connecting to IntesisBox %s:%s failed, retrying in %.0fs: %s",
+                    self._ip,
+                    self._port,
+                    delay,
+                    exc,
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            if deadline is None:
+                ready_timeout: float = RECONNECT_READY_TIMEOUT
+            else:
+                ready_timeout = deadline - self._eventLoop.time()
+            try:
+                await self.wait_ready(ready_timeout)
+            except TimeoutError:
+                # The socket is open but the device never answered; close it
+                # so the next attempt starts a fresh handshake.
+                if self._transport:
+                    self._transport.close()
+                if deadline is not None:
+                    raise
+                delay = self._connect_failed()
+                _LOGGER.debug(
+                    "IntesisBox %s:%s did not answer, reconnecting in %.0fs",
+                    self._ip,
+                    self._port,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            self._connect_delay = CONNECT_BACKOFF_INITIAL
+            if self._connect_failures >= CONNECT_FAILURES_WARNING:
+                _LOGGER.info(
+                    "IntesisBox %s:%s is reachable again", self._ip, self._port
+                )
+            self._connect_failures = 0
+            return
+
+    def _connect_failed(self) -> float:
+        """Count a failed attempt and return how long to wait before the next."""
+        self._connect_failures += 1
+        if self._connect_failures == CONNECT_FAILURES_WARNING:
+            _LOGGER.warning(
+                "IntesisBox %s:%s is unreachable, retrying every %ds at most",
+                self._ip,
+                self._port,
+                CONNECT_BACKOFF_MAX,
+            )
+        return self._next_backoff()
+
+    def _next_backoff(self) -> float:
+        """Return the next jittered retry delay and double the following one."""
+        delay = self._connect_delay
+        self._connect_delay = min(delay * 2, CONNECT_BACKOFF_MAX)
+        return delay * (1 + random.uniform(0, CONNECT_BACKOFF_JITTER))
+
+    async def __aenter__(self) -> IntesisBox:
+        """Use the controller as a short-lived connection."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the connection and wait for the socket to go away."""
+        self.stop()
+        with contextlib.suppress(TimeoutError):
+            await self.wait_for_disconnect(CLOSE_TIMEOUT)
+
+    async def async_maintain_connection(self) -> None:
+        """Reconnect whenever the connection drops, until stop() is called."""
+        while True:
+            await self._disconnected_event.wait()
+            if self._stopped:
+                return
+            _LOGGER.debug("Reconnecting to IntesisBox %s:%s", self._ip, self._port)
+            with contextlib.suppress(TimeoutError):
+                await self.async_connect(None)
+            if self._stopped and self._transport:
+                # stop() was called while the connection was being opened.
+                self._transport.close()
+
     def stop(self):
         """Public method for shutting down connectivity with the envisalink."""
+        self._stopped = True
         self._connectionStatus = API_DISCONNECTED
-        self._transport.close()
+        if self._transport:
+            self._transport.close()
 
-    async def poll_status(self, sendcallback=False):
-        """Periodically poll for updates since the controllers don't always update reliably."""
-        while self.is_connected:
-            _LOGGER.debug("Polling for update")
-            self._write("GET,1:*")
-            await asyncio.sleep(60 * 5)  # 5 minutes
-        else:
-            _LOGGER.debug("Not connected, skipping poll_status()")
+    async def wait_for_disconnect(self, timeout: float) -> None:
+        """Wait until the socket has actually been closed."""
+        await asyncio.wait_for(self._disconnected_event.wait(), timeout)
+
+    async def wait_ready(self, timeout: float) -> None:
+        """Wait until the device has reported its ID, modes and fan speeds."""
+        await asyncio.wait_for(self._ready_event.wait(), timeout)
 
     def set_temperature(self, setpoint):
         """Public method for setting the temperature."""
-        set_temp = int(setpoint * 10)
+        set_temp = round(setpoint * 10)
         self._set_value(FUNCTION_SETPOINT, set_temp)
 
     def set_fan_speed(self, fan_speed):
@@ -261,34 +646,49 @@ class IntesisBox(asyncio.Protocol):
     def _set_value(self, uid: str, value: str | int) -> None:
         """Change a setting on the thermostat."""
         try:
-            asyncio.run(self._writeasync(f"SET,1:{uid},{value}"))
+            cmd = SET_PREFIX[uid] + str(value).encode("ascii") + b"\r"
+            self._spawn(self._writeasync(cmd))
         except Exception as e:
             _LOGGER.error("%s Exception. %s / %s", type(e), e.args, e)
 
     def set_mode(self, mode):
         """Send mode and confirm change before turning on."""
         """Some units return responses out of order"""
-        _LOGGER.debug(f"Setting MODE to {mode}.")
+        _LOGGER.debug("Setting MODE to %s.", mode)
+        self._spawn(self._set_mode_async(mode))
+
+    async def _set_mode_async(self, mode):
+        """Set the mode and, if the unit is off, power on once it's confirmed."""
+        was_on = self.is_on
         if mode in MODES:
-            self._set_value(FUNCTION_MODE, mode)
-        if not self.is_on:
-            """Check to ensure in correct mode before turning on"""
-            retry = 30
-            while self.mode != mode and retry > 0:
-                _LOGGER.debug(
-                    f"Waiting for MODE to return {mode}, currently {str(self.mode)}"
-                )
-                _LOGGER.debug(f"Retry attempt = {retry}")
-                asyncio.run(self._writeasync("GET,1:MODE"))
-                retry -= 1
-            else:
-                if retry != 0:
+            await self._writeasync(
+                SET_PREFIX[FUNCTION_MODE] + mode.encode("ascii") + b"\r"
+            )
+        if was_on:
+            return
+
+        # Check to ensure in correct mode before turning on
+        self._mode_change_target = mode
+        try:
+            async with asyncio.timeout(MODE_SET_TIMEOUT):
+                while self.mode != mode:
                     _LOGGER.debug(
-                        f"MODE confirmed now {str(self.mode)}, proceed to Power On"
+                        "Waiting for MODE to return %s, currently %s", mode, self.mode
                     )
-                    self.set_power_on()
-                else:
-                    _LOGGER.error("Cannot set Intesisbox mode giving up...")
+                    self._mode_change_event.clear()
+                    self._write_bytes(CMD_GET_MODE)
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(
+                            self._mode_change_event.wait(), MODE_QUERY_INTERVAL
+                        )
+        except TimeoutError:
+            _LOGGER.error("Cannot set Intesisbox mode giving up...")
+            return
+        finally:
+            self._mode_change_target = None
+
+        _LOGGER.debug("MODE confirmed now %s, proceed to Power On", mode)
+        await self._writeasync(CMD_POWER_ON)
 
     def set_mode_dry(self):
         """Public method to set device to dry asynchronously."""
@@ -360,14 +760,14 @@ class IntesisBox(asyncio.Protocol):
     @property
     def setpoint(self) -> float | None:
         """Public method returns the target temperature."""
-        setpoint = self._device.get(FUNCTION_SETPOINT)
-        return (int(setpoint) / 10) if setpoint else None
+        setpoint = self._temperatures.get(FUNCTION_SETPOINT)
+        return setpoint / 10 if setpoint is not None else None
 
     @property
     def ambient_temperature(self) -> float | None:
         """Public method returns the current temperature."""
-        temperature = self._device.get(FUNCTION_AMBTEMP)
-        return (int(temperature) / 10) if temperature else None
+        temperature = self._temperatures.get(FUNCTION_AMBTEMP)
+        return temperature / 10 if temperature is not None else None
 
     @property
     def max_setpoint(self) -> float | None:
@@ -394,8 +794,39 @@ class IntesisBox(asyncio.Protocol):
         """Current horizontal vane setting."""
         return self._device.get(FUNCTION_VANELR)
 
+    def snapshot(self) -> tuple:
+        """Return the current state in one call.
+
+        The tuple holds is_on, ambient_temperature, min_setpoint,
+        max_setpoint, setpoint, fan_speed, mode, vertical_swing and
+        horizontal_swing, in that order.
+        """
+        device = self._device
+        ambient = self._temperatures.get(FUNCTION_AMBTEMP)
+        setpoint = self._temperatures.get(FUNCTION_SETPOINT)
+        return (
+            device.get(FUNCTION_ONOFF) == POWER_ON,
+            ambient / 10 if ambient is not None else None,
+            self._setpoint_minimum,
+            self._setpoint_maximum,
+            setpoint / 10 if setpoint is not None else None,
+            device.get(FUNCTION_FANSP),
+            device.get(FUNCTION_MODE),
+            device.get(FUNCTION_VANEUD),
+            device.get(FUNCTION_VANELR),
+        )
+
     def _send_update_callback(self):
+        """Notify listeners once for all changes made within UPDATE_CALLBACK_DELAY."""
+        if not self._update_pending:
+            self._update_pending = True
+            self._eventLoop.call_later(
+                UPDATE_CALLBACK_DELAY, self._flush_update_callbacks
+            )
+
+    def _flush_update_callbacks(self):
         """Notify all listeners that state of the thermostat has changed."""
+        self._update_pending = False
         if not self._updateCallbacks:
             _LOGGER.debug("Update callback has not been set by client.")
 
@@ -417,6 +848,11 @@ class IntesisBox(asyncio.Protocol):
         """Returns true if the TCP connection is established."""
         return self._connectionStatus == API_AUTHENTICATED
 
+    @property
+    def is_ready(self) -> bool:
+        """Returns true once connected and the modes and fan speeds are known."""
+        return bool(self._operation_list and self._fan_speed_list and self.is_connected)
+
     @property
     def error_message(self) -> str | None:
         """Returns the last error message, or None if there were no errors."""